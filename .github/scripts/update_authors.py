@@ -2,12 +2,20 @@ import os
 import subprocess
 from pathlib import Path
 import json
+import re
 import time
-from git import Repo
+import tempfile
+from collections import Counter
+from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
+import functools
 
 import jwt
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
 import argparse
 
 # --- Configuration ---
@@ -15,30 +23,155 @@ AUTHORS_FILE = Path("AUTHORS.md")
 ORG = "GDMMORPG"
 REPO = "Godot-MMORPG"
 
-ENGINEERING_EXTENSIONS 	= [".gd", ".go", ".cpp", ".h", ".cs", ".rs", ".py", ".sh", ".bat", ".yml", ".yaml", ".sql", ".json", ".xml", ".ini", ".cfg", ".toml"]
-ENGINEERING_CRITRIA 	= ["added", "modified", "removed", "renamed"]
-ART_EXTENSIONS 			= [".glb", ".gltf", ".fbx", ".png", ".jpg", ".jpeg", ".tga", ".wav", ".mp3", ".ogg", ".psd", ".xcf"]
-ART_CRITRIA 			= ["added", "modified", "removed", "renamed"]
-DESIGN_EXTENSIONS 		= [".tscn", ".tres"]
-DESIGN_CRITRIA 			= ["added", "modified", "removed", "renamed"]
-COMMUNITY_EXTENSIONS 	= [".md", ".translation"]
-COMMUNITY_CRITRIA 		= ["added", "modified", "removed", "renamed"]
+# Installation tokens live for an hour, keep them around so repeated runs skip minting a new one.
+# Only cached inside the runner's private temp directory, never in a shared one such as /tmp.
+TOKEN_CACHE_FILE = Path(os.environ["RUNNER_TEMP"]) / "gh_token.json" if os.getenv("RUNNER_TEMP") else None
+TOKEN_EXPIRY_MARGIN = 60
+
+ENGINEERING_EXTENSIONS 	= (".gd", ".go", ".cpp", ".h", ".cs", ".rs", ".py", ".sh", ".bat", ".yml", ".yaml", ".sql", ".json", ".xml", ".ini", ".cfg", ".toml")
+ENGINEERING_CRITRIA 	= frozenset({"added", "modified", "removed", "renamed"})
+ART_EXTENSIONS 			= (".glb", ".gltf", ".fbx", ".png", ".jpg", ".jpeg", ".tga", ".wav", ".mp3", ".ogg", ".psd", ".xcf")
+ART_CRITRIA 			= frozenset({"added", "modified", "removed", "renamed"})
+DESIGN_EXTENSIONS 		= (".tscn", ".tres")
+DESIGN_CRITRIA 			= frozenset({"added", "modified", "removed", "renamed"})
+COMMUNITY_EXTENSIONS 	= (".md", ".translation")
+COMMUNITY_CRITRIA 		= frozenset({"added", "modified", "removed", "renamed"})
+
+# Flattened extension lookup, so categorizing a file is a single dict probe.
+EXT_TO_CATEGORY: dict[str, str] = (
+	{ext: "Engineering" for ext in ENGINEERING_EXTENSIONS}
+	| {ext: "Art" for ext in ART_EXTENSIONS}
+	| {ext: "Design" for ext in DESIGN_EXTENSIONS}
+	| {ext: "Community & Support" for ext in COMMUNITY_EXTENSIONS}
+)
+CATEGORY_CRITERIA: dict[str, frozenset[str]] = {
+	"Engineering": ENGINEERING_CRITRIA,
+	"Art": ART_CRITRIA,
+	"Design": DESIGN_CRITRIA,
+	"Community & Support": COMMUNITY_CRITRIA,
+}
+# Categories in priority order, used to break ties between equal contribution counts.
+CATEGORY_ORDER: tuple[str, ...] = tuple(CATEGORY_CRITERIA)
+
+# Category sections start at a '### ' header and run up to the next heading or horizontal rule.
+SECTION_HEADER_PATTERN = re.compile(rb"^### (.+)$", re.MULTILINE)
+SECTION_END_PATTERN = re.compile(rb"^(?:#|---)", re.MULTILINE)
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# GraphQL reports file changes as an enum, map them onto the REST style statuses used by the criteria above.
+CHANGE_TYPE_STATUS = {
+	"ADDED": "added",
+	"MODIFIED": "modified",
+	"DELETED": "removed",
+	"RENAMED": "renamed",
+	"COPIED": "copied",
+	"CHANGED": "changed",
+}
+
+# Only the fields the script reads are requested, the REST file listing also carries patches and blob details.
+PULL_REQUEST_FILES_FRAGMENT = """
+files(first: 100, after: $cursor) {
+	nodes { path changeType }
+	pageInfo { hasNextPage endCursor }
+}
+"""
+
+PULL_REQUEST_QUERY = """
+query($owner: String!, $name: String!, $num: Int!, $cursor: String) {
+	repository(owner: $owner, name: $name) {
+		defaultBranchRef { name }
+		pullRequest(number: $num) {
+			url
+			author {
+				login
+				url
+				... on User { name }
+			}
+			%s
+		}
+	}
+}
+""" % PULL_REQUEST_FILES_FRAGMENT
+
+PULL_REQUEST_FILES_QUERY = """
+query($owner: String!, $name: String!, $num: Int!, $cursor: String) {
+	repository(owner: $owner, name: $name) {
+		pullRequest(number: $num) {
+			%s
+		}
+	}
+}
+""" % PULL_REQUEST_FILES_FRAGMENT
+
+CREATE_COMMIT_MUTATION = """
+mutation($input: CreateCommitOnBranchInput!) {
+	createCommitOnBranch(input: $input) {
+		commit { url }
+	}
+}
+"""
 
 
 # --- Auth using GitHub App ---
+def read_cached_token(installation_id: str) -> str | None:
+	"""Return the cached installation token if it is still valid for this installation."""
+	if TOKEN_CACHE_FILE is None:
+		return None
+	try:
+		cached = json.loads(TOKEN_CACHE_FILE.read_text())
+	except (OSError, ValueError):
+		return None
+	if cached.get("installation_id") != installation_id:
+		return None
+	if time.time() >= cached.get("expires_at", 0) - TOKEN_EXPIRY_MARGIN:
+		return None
+	return cached.get("token")
+
+def write_cached_token(installation_id: str, token: str, expires_at: float):
+	"""Atomically persist the installation token so only the owner can read it."""
+	if TOKEN_CACHE_FILE is None:
+		return
+	temp_file = None
+	try:
+		# mkstemp creates a fresh file exclusively with owner only permissions.
+		fd, temp_file = tempfile.mkstemp(dir=TOKEN_CACHE_FILE.parent, prefix=".gh_token.", suffix=".tmp")
+		with os.fdopen(fd, "w") as f:
+			json.dump({"installation_id": installation_id, "token": token, "expires_at": expires_at}, f)
+		os.replace(temp_file, TOKEN_CACHE_FILE)
+	except OSError as e:
+		print(f"⚠️  Unable to cache installation token: {e}")
+		if temp_file and os.path.exists(temp_file):
+			os.remove(temp_file)
+
+@functools.cache
+def load_private_key() -> RSAPrivateKey:
+	"""Validate and deserialize the GitHub App private key, parsing the PEM only once per process."""
+	if "PRIVATE_KEY" not in os.environ:
+		raise EnvironmentError("PRIVATE_KEY is not set in environment variables.")
+
+	try:
+		private_key = load_pem_private_key(os.environ["PRIVATE_KEY"].encode(), password=None)
+	except ValueError as e:
+		raise EnvironmentError(f"PRIVATE_KEY is not a valid PEM private key: {e}") from e
+	if not isinstance(private_key, RSAPrivateKey):
+		raise EnvironmentError("PRIVATE_KEY must be an RSA private key.")
+	return private_key
+
 def get_installation_token():
-	"""Generate a GitHub App installation token."""
+	"""Generate a GitHub App installation token, reusing a cached one until it is about to expire."""
 
 	if "APP_ID" not in os.environ:
 		raise EnvironmentError("APP_ID is not set in environment variables.")
 	if "INSTALLATION_ID" not in os.environ:
 		raise EnvironmentError("INSTALLATION_ID is not set in environment variables.")
-	if "PRIVATE_KEY" not in os.environ:
-		raise EnvironmentError("PRIVATE_KEY is not set in environment variables.")
 
 	app_id = os.environ["APP_ID"]
 	installation_id = os.environ["INSTALLATION_ID"]
-	private_key = os.environ["PRIVATE_KEY"].encode()
+
+	cached_token = read_cached_token(installation_id)
+	if cached_token:
+		return cached_token
 
 	payload = {
 		"iat": int(time.time()) - 60,
@@ -46,209 +179,292 @@ def get_installation_token():
 		"iss": app_id,
 	}
 
-	jwt_token = jwt.encode(payload, private_key, algorithm="RS256")
+	jwt_token = jwt.encode(payload, load_private_key(), algorithm="RS256")
 
 	headers = {"Authorization": f"Bearer {jwt_token}", "Accept": "application/vnd.github+json"}
 	url = f"https://api.github.com/app/installations/{installation_id}/access_tokens"
 	res = requests.post(url, headers=headers)
 	res.raise_for_status()
-	return res.json()["token"]
+	token_info = res.json()
+	expires_at = datetime.fromisoformat(token_info["expires_at"].replace("Z", "+00:00")).timestamp()
+	write_cached_token(installation_id, token_info["token"], expires_at)
+	return token_info["token"]
 
 # --- Helper Functions ---
-def detect_category(files_changed: list[str]) -> str:
-	"""Determine which category best matches the PR changes."""
-	categories = {"Engineering": 0, "Art": 0, "Design": 0, "Community & Support": 0}
-	for f in files_changed:
-		f_lower: str = f.lower()
-		for extension in ENGINEERING_EXTENSIONS:
-			if f_lower.endswith(extension):
-				categories["Engineering"] += 1
-		for extension in ART_EXTENSIONS:
-			if f_lower.endswith(extension):
-				categories["Art"] += 1
-		for extension in DESIGN_EXTENSIONS:
-			if f_lower.endswith(extension):
-				categories["Design"] += 1
-		for extension in COMMUNITY_EXTENSIONS:
-			if f_lower.endswith(extension):
-				categories["Community & Support"] += 1
-	# Return the dominant category
-	return max(categories, key=categories.get)
-
-def update_authors_md(pr_number: str, is_dry_run: bool = False):
-	"""Insert or update a contributor under the right category in AUTHORS.md."""
-	repo = Repo(".")
-	token = get_installation_token()
-	headers = {
+def create_session(token: str, retry_requests: bool = True) -> requests.Session:
+	"""Create a keep-alive session for the GitHub API, optionally retrying transient failures."""
+	session = requests.Session()
+	session.headers.update({
 		"Authorization": f"Bearer {token}",
 		"Accept": "application/vnd.github+json",
 		"X-GitHub-Api-Version": "2022-11-28"
+	})
+	# Queries are retried, mutations pass retry_requests=False so they are never sent twice.
+	retry = Retry(
+		total=3,
+		backoff_factor=0.3,
+		status_forcelist=[429, 500, 502, 503, 504],
+		allowed_methods=frozenset({"POST"}),
+	) if retry_requests else 0
+	session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry))
+	return session
+
+def graphql(session: requests.Session, query: str, variables: dict) -> dict:
+	"""Execute a GraphQL query against the GitHub API and return its data."""
+	res = session.post(GRAPHQL_URL, json={"query": query, "variables": variables})
+	res.raise_for_status()
+	body = res.json()
+	if body.get("errors"):
+		raise RuntimeError(f"GraphQL request failed: {body['errors']}")
+	return body["data"]
+
+def fetch_pr_files(session: requests.Session, pr_number: int, first_page: dict | None = None) -> list[dict]:
+	"""Fetch every file changed by a PR, following the GraphQL cursor until all pages are read."""
+	variables = {"owner": ORG, "name": REPO, "num": pr_number, "cursor": None}
+	page = first_page
+	files: list[dict] = []
+	while True:
+		if page is None:
+			page = graphql(session, PULL_REQUEST_FILES_QUERY, variables)["repository"]["pullRequest"]["files"]
+		for node in page["nodes"]:
+			files.append({
+				"filename": node["path"],
+				"status": CHANGE_TYPE_STATUS.get(node["changeType"], node["changeType"].lower()),
+			})
+		if not page["pageInfo"]["hasNextPage"]:
+			return files
+		variables["cursor"] = page["pageInfo"]["endCursor"]
+		page = None
+
+def fetch_pull_request(session: requests.Session, pr_number: int) -> tuple[dict, list[dict], dict]:
+	"""Fetch the PR author, its changed files and the default branch, the first page of files arrives with the PR itself."""
+	variables = {"owner": ORG, "name": REPO, "num": pr_number, "cursor": None}
+	repository = graphql(session, PULL_REQUEST_QUERY, variables)["repository"]
+	pr = repository["pullRequest"]
+	files = fetch_pr_files(session, pr_number, first_page=pr["files"])
+	return pr, files, repository["defaultBranchRef"]
+
+def get_checkout_head_oid() -> str:
+	"""Return the commit the local files were checked out from, GITHUB_SHA in workflows or git HEAD otherwise."""
+	if os.getenv("GITHUB_SHA"):
+		return os.environ["GITHUB_SHA"]
+	try:
+		return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+	except (OSError, subprocess.CalledProcessError) as e:
+		raise EnvironmentError("GITHUB_SHA is not set and the checked out commit could not be resolved.") from e
+
+def commit_file(session: requests.Session, branch: dict, path: Path, content: str, message: str) -> dict:
+	"""Commit a single file onto the branch in one request.
+
+	The content is built from the local checkout, so the commit is expected to land directly on the checked out
+	commit and fails if the branch has moved since, rather than overwriting changes made in the meantime.
+	"""
+	commit_input = {
+		"branch": {"repositoryNameWithOwner": f"{ORG}/{REPO}", "branchName": branch["name"]},
+		"message": {"headline": message},
+		"fileChanges": {
+			"additions": [{
+				"path": path.as_posix(),
+				"contents": base64.b64encode(content.encode("utf-8")).decode("utf-8"),
+			}],
+		},
+		"expectedHeadOid": get_checkout_head_oid(),
 	}
+	return graphql(session, CREATE_COMMIT_MUTATION, {"input": commit_input})["createCommitOnBranch"]["commit"]
+
+def parse_sections(buf: bytes) -> tuple[list[list[str]], dict[str, list[str]]]:
+	"""Split AUTHORS.md into ordered chunks and expose the lines of every category section by name.
+
+	Text outside of the category sections is kept as a single chunk, section lines keep their line endings.
+	A section runs from its header up to the next heading or horizontal rule.
+	"""
+	chunks: list[list[str]] = []
+	sections: dict[str, list[str]] = {}
+	position = 0
+	for header in SECTION_HEADER_PATTERN.finditer(buf):
+		body_start = header.end() + 1
+		if body_start > len(buf):
+			break
+		section_end = SECTION_END_PATTERN.search(buf, body_start)
+		body_end = section_end.start() if section_end else len(buf)
+
+		body = buf[body_start:body_end].decode("utf-8").splitlines(keepends=True)
+		chunks.append([buf[position:body_start].decode("utf-8")])
+		chunks.append(body)
+		sections[header.group(1).decode("utf-8").strip()] = body
+		position = body_end
+	chunks.append([buf[position:].decode("utf-8")])
+	return chunks, sections
+
+def serialize_sections(chunks: list[list[str]]) -> bytes:
+	"""Join the chunks produced by parse_sections back into the AUTHORS.md contents."""
+	return "".join("".join(chunk) for chunk in chunks).encode("utf-8")
+
+def dominant_category(categories: Counter[str]) -> str:
+	"""Pick the category with the highest count, preferring the earlier category in CATEGORY_ORDER on a tie."""
+	if not categories:
+		return "Community & Support"
+	return max(categories, key=lambda category: (categories[category], -CATEGORY_ORDER.index(category)))
 
-	# Fetch PR details.
-	# Todo: Retrieve PR details beyond the pull requester, such as co-authors.
-	pr = requests.get(
-		f"https://api.github.com/repos/{ORG}/{REPO}/pulls/{pr_number}",
-		headers=headers,
-	).json()
-
-	username = pr["user"]["login"]
-
-	files = requests.get(
-		f"https://api.github.com/repos/{ORG}/{REPO}/pulls/{pr_number}/files",
-		headers=headers,
-	).json()
+def detect_category(files_changed: list[str]) -> str:
+	"""Determine which category best matches the PR changes."""
+	categories = Counter(filter(None, (EXT_TO_CATEGORY.get(Path(f).suffix.lower()) for f in files_changed)))
+	# Return the dominant category
+	return dominant_category(categories)
 
-	account_details = requests.get(
-		f"https://api.github.com/users/{username}",
-		headers=headers,
-	).json()
+def record_contribution(sections: dict[str, list[str]], pr_number: int, pr: dict, files: list[dict]) -> bool:
+	"""Insert or update the PR author under the right category section, returning whether anything changed."""
+	# GraphQL reports deleted accounts as a missing author, there is nobody to credit.
+	if pr["author"] is None:
+		print(f"⚠️  Skipping PR #{pr_number}, its author account no longer exists")
+		return False
+	username = pr["author"]["login"]
 
 	# Aggregate authors and their PRs
-	print(f"Processing PR #{pr_number} by user '{pr['user']['login']}'")
+	print(f"Processing PR #{pr_number} by user '{username}'")
 	# print(f"Files changed in PR: {[file['filename'] for file in files]}")
 	print(f"Number of files changed: {len(files)}")
 	# print(f"PR Details: {json.dumps(pr, indent=2)}")
-	# print(f"Account Details: {json.dumps(account_details, indent=2)}")
-	display_name = account_details.get("name") or username 
-	profile_url = pr["user"]["html_url"]
-	pr_url = pr["html_url"]
-	contribution_categories: dict[str, int] = dict()
+	display_name = pr["author"].get("name") or username
+	profile_url = pr["author"]["url"]
+	pr_url = pr["url"]
+	contribution_categories: Counter[str] = Counter()
 	for file in files:
-		filename: str = file["filename"].lower()
-		status: str = file["status"].lower()
-
-		contribution_categories.setdefault("Engineering", 0)
-		contribution_categories.setdefault("Art", 0)
-		contribution_categories.setdefault("Design", 0)
-		contribution_categories.setdefault("Community & Support", 0)
-
-		if any(filename.endswith(ext) for ext in ENGINEERING_EXTENSIONS) and status in ENGINEERING_CRITRIA:
-			contribution_categories["Engineering"] += 1
-		if any(filename.endswith(ext) for ext in ART_EXTENSIONS) and status in ART_CRITRIA:
-			contribution_categories["Art"] += 1
-		if any(filename.endswith(ext) for ext in DESIGN_EXTENSIONS) and status in DESIGN_CRITRIA:
-			contribution_categories["Design"] += 1
-		if any(filename.endswith(ext) for ext in COMMUNITY_EXTENSIONS) and status in COMMUNITY_CRITRIA:
-			contribution_categories["Community & Support"] += 1
+		file_category = EXT_TO_CATEGORY.get(Path(file["filename"]).suffix.lower())
+		if file_category and file["status"].lower() in CATEGORY_CRITERIA[file_category]:
+			contribution_categories[file_category] += 1
 
 	# Determine dominant category
-	category = "Community & Support"
+	category = dominant_category(contribution_categories)
 	if contribution_categories:
-		# Determine the category with the highest contribution count
-		category = max(contribution_categories, key=contribution_categories.get)
 		# Print out the scores for debugging
 		print(f"Contribution scores: {contribution_categories}, selected category: {category}")
 	
-	# Read and update AUTHORS.md
-	content = AUTHORS_FILE.read_text().splitlines()
 	contributor_format = f"- [{display_name}]({profile_url})"
 	contributor_ref_format = f"PRs: "
 	contributor_ref_tag_format = f"[#{pr_number}]({pr_url})"
 
-	# Find category section header
-	try:
-		start_index = content.index(f"### {category}") + 1
-	except ValueError:
+	# Find category section
+	if category not in sections:
 		print(f"Category '{category}' not found in AUTHORS.md.")
-		return
+		return False
+	content = sections[category]
 
 	# Search if contributor already exists
-	existing_idx = None
-	for i, line in enumerate(content[start_index:], start=start_index):
-		if line.startswith("### "):  # stop at next category
-			break
-		if contributor_format in line:
-			existing_idx = i
-			break
-	
-	did_nothing = False
+	existing_idx = next((i for i, line in enumerate(content) if contributor_format in line), None)
 
-	if existing_idx:
+	if existing_idx is not None:
 		# Append new PR tag if not already there
 		j = existing_idx + 1
 		# Find the end of the contributor's PR tags
 		while j < len(content) and content[j].startswith(">"):
 			if contributor_ref_tag_format in content[j]:
 				# PR tag already exists
-				did_nothing = True
-				break
+				print(f"ℹ️  No update needed for {username}")
+				return False
 			j += 1
+
+	# A section at the end of the file may lack a final line ending, terminate it before adding lines after it.
+	if content and not content[-1].endswith("\n"):
+		content[-1] += "\n"
+
+	if existing_idx is not None:
 		# Insert new PR tag
-		if j == len(content) or not content[j].startswith(">"):
-			content.insert(j, f"> {contributor_ref_tag_format}")
+		content.insert(j, f"> {contributor_ref_tag_format}\n")
 	else:
-		# Insert a new contributor entry
-		insert_index = start_index
-		while insert_index < len(content) and not content[insert_index].startswith("### "):
-			insert_index += 1
-		# Insert before the next category or at the end of the section
-		# Insert the contributor
-		content.insert(insert_index, contributor_format)
-		# Insert the PR reference
-		content.insert(insert_index + 1, f"> {contributor_ref_format}")
-		content.insert(insert_index + 2, f"> {contributor_ref_tag_format}")
-		content.insert(insert_index + 3, "")  # Add a blank line for readability
-
-	if did_nothing:
-		print(f"ℹ️  No update needed for {username}")
+		# Append a new contributor entry to the end of the section
+		content.append(f"{contributor_format}\n")
+		# Append the PR reference
+		content.append(f"> {contributor_ref_format}\n")
+		content.append(f"> {contributor_ref_tag_format}\n")
+		content.append("\n")  # Add a blank line for readability
+
+	print(f"✅ Updated AUTHORS.md for {username} in {category}")
+	return True
+
+def update_authors_md(pr_numbers: list[int], is_dry_run: bool = False):
+	"""Record the contributors of the given PRs in AUTHORS.md and push them in a single commit."""
+	buf = AUTHORS_FILE.read_bytes()
+
+	# Skip PRs that have already been recorded, and all GitHub API calls if none are left.
+	pending_pr_numbers: list[int] = []
+	for pr_number in dict.fromkeys(pr_numbers):
+		if f"[#{pr_number}](".encode("utf-8") in buf:
+			print(f"ℹ️  PR #{pr_number} is already recorded in AUTHORS.md")
+		else:
+			pending_pr_numbers.append(pr_number)
+	if not pending_pr_numbers:
+		return
+
+	token = get_installation_token()
+	session = create_session(token)
+	chunks, sections = parse_sections(buf)
+
+	updated_pr_numbers: list[int] = []
+	usernames: list[str] = []
+	branch = None
+	for pr_number in pending_pr_numbers:
+		# Fetch PR details, changed files and the author's profile in a single GraphQL query.
+		# Todo: Retrieve PR details beyond the pull requester, such as co-authors.
+		try:
+			pr, files, branch = fetch_pull_request(session, pr_number)
+			if not record_contribution(sections, pr_number, pr, files):
+				continue
+		except (requests.RequestException, RuntimeError) as e:
+			# Keep the rest of the batch, a single bad PR number should not discard it.
+			print(f"❌ Failed to process PR #{pr_number}: {e}")
+			continue
+		updated_pr_numbers.append(pr_number)
+		if pr["author"]["login"] not in usernames:
+			usernames.append(pr["author"]["login"])
+
+	if not updated_pr_numbers:
 		return
 
 	# Write back to AUTHORS.md
-	AUTHORS_FILE.write_text("\n".join(content))
-	print(f"✅ Updated AUTHORS.md for {username} in {category}")
+	new_buf = serialize_sections(chunks)
+	AUTHORS_FILE.write_bytes(new_buf)
 
 	# Commit and push changes.
-	repo.index.add([str(AUTHORS_FILE)])
-	commit_message = f"Update AUTHORS.md: Add {username} for PR #{pr_number}"
-	if repo.is_dirty():
-		if not is_dry_run:
-			content_base64 = base64.b64encode("\n".join(content).encode("utf-8")).decode("utf-8")
-			file_info = requests.get(
-				f"https://api.github.com/repos/{ORG}/{REPO}/contents/{AUTHORS_FILE}",
-				headers=headers,
-			).json()
-			sha = file_info["sha"]
-
-			send_edit = requests.put(
-				f"https://api.github.com/repos/{ORG}/{REPO}/contents/{AUTHORS_FILE}",
-				headers=headers,
-				json={
-					"message": commit_message, 
-					"content": content_base64,
-					"sha": sha,
-				}
-			)
-
-			if send_edit.status_code == 200 or send_edit.status_code == 201:
-				print(f"🚀 Pushed changes to AUTHORS.md with commit: {commit_message}")
-			else:
-				print(f"❌ Failed to push changes: {send_edit.status_code} - {send_edit.json()}")
-		else:
-			print(f"🧪 Dry run - commit message: {commit_message}")
-			print(f"🧪 Dry run mode: Changes not pushed.")
-		
+	pr_references = ", ".join(f"#{pr_number}" for pr_number in updated_pr_numbers)
+	commit_message = f"Update AUTHORS.md: Add {', '.join(usernames)} for PR{'s' if len(updated_pr_numbers) > 1 else ''} {pr_references}"
+	if not is_dry_run:
+		try:
+			commit = commit_file(create_session(token, retry_requests=False), branch, AUTHORS_FILE, new_buf.decode("utf-8"), commit_message)
+			print(f"🚀 Pushed changes to AUTHORS.md with commit: {commit_message} ({commit['url']})")
+		except (requests.RequestException, RuntimeError, EnvironmentError) as e:
+			print(f"❌ Failed to push changes: {e}")
+	else:
+		print(f"🧪 Dry run - commit message: {commit_message}")
+		print(f"🧪 Dry run mode: Changes not pushed.")
+
+def parse_pr_numbers(value: str) -> list[int]:
+	"""Parse a comma separated list of PR numbers."""
+	return [int(pr_number) for pr_number in value.split(",") if pr_number.strip()]
 
-def get_merged_pr_info() -> str:
-	"""Retrieve merged PR info using GitHub environment variables or git commands."""
-	pr_number = os.getenv("PR_NUMBER")
+def get_merged_pr_info() -> list[int]:
+	"""Retrieve merged PR numbers using GitHub environment variables, PR_NUMBER may hold a comma separated list."""
+	pr_numbers = parse_pr_numbers(os.getenv("PR_NUMBER", ""))
 
-	if not pr_number:
+	if not pr_numbers:
 		raise EnvironmentError("PR_NUMBER is not set in environment variables.")
 
-	return pr_number
+	return pr_numbers
 
 # --- Main Execution ---
 if __name__ == "__main__":
 	# Proceed to update AUTHORS.md
 	parser = argparse.ArgumentParser(description="Update AUTHORS.md with contributor information")
 	parser.add_argument("--dry-run", action="store_true", help="Use dummy information for testing")
+	parser.add_argument("--prs", type=parse_pr_numbers, help="Comma separated PR numbers to process in a single commit, e.g. 1,2,3")
 	args = parser.parse_args()
 	
-	if args.dry_run:
-		pr_number = "9"
+	if args.prs:
+		pr_numbers = args.prs
+	elif args.dry_run:
+		pr_numbers = [9]
 		print("🧪 Running in dry-run mode with dummy data")
 	else:
-		pr_number = get_merged_pr_info()
+		pr_numbers = get_merged_pr_info()
 	
-	update_authors_md(pr_number, is_dry_run=args.dry_run)
+	update_authors_md(pr_numbers, is_dry_run=args.dry_run)